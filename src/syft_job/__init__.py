@@ -1,8 +1,22 @@
 __version__ = "0.1.21"
 
-from .client import JobClient, get_client
-from .config import SyftJobConfig
-from .job_runner import SyftJobRunner, create_runner
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import JobClient, get_client
+    from .config import SyftJobConfig
+    from .job_runner import SyftJobRunner, create_runner
+
+# Public names are imported from their submodule on first access (PEP 562), so
+# `import syft_job` and the runner CLI don't pay for modules they never use.
+_LAZY = {
+    "JobClient": "client",
+    "get_client": "client",
+    "SyftJobConfig": "config",
+    "SyftJobRunner": "job_runner",
+    "create_runner": "job_runner",
+}
 
 __all__ = [
     # SyftBox job system
@@ -12,3 +26,16 @@ __all__ = [
     "SyftJobRunner",
     "create_runner",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,292 +1,145 @@
+import html
 import os
 import re
 import shutil
+import stat
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Set, Tuple
 
 import yaml
 
 from .config import SyftJobConfig
 
+# Use the libyaml C bindings when PyYAML was built with them; they parse and
+# emit config.yaml several times faster than the pure-Python implementation
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# fcntl only exists on POSIX; without it files are always copied
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+# run.sh template for Python jobs (dependencies are installed with uv). Every
+# job gets its own venv so no state leaks between jobs from different
+# submitters; uv's global cache keeps repeated installs of the same packages cheap
+_PYTHON_RUN_SCRIPT_TEMPLATE = """#!/bin/bash
+export UV_SYSTEM_PYTHON=false
 
-class StdoutViewer:
-    """A viewer for stdout content with scrollable display in Jupyter notebooks."""
-
-    def __init__(self, job_info: "JobInfo"):
-        self.job_info = job_info
-
-    def _strip_ansi_codes(self, text: str) -> str:
-        """Remove ANSI escape sequences from text."""
-        # Pattern to match ANSI escape sequences
-        ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
-        return ansi_escape.sub("", text)
+# Create isolated uv virtual environment
+uv venv
 
-    def _convert_ansi_to_html(self, text: str) -> str:
-        """Convert ANSI color codes to HTML spans."""
-        # Basic ANSI color code mapping
-        ansi_colors = {
-            "30": "color: #000000;",  # black
-            "31": "color: #cd3131;",  # red
-            "32": "color: #00bc00;",  # green
-            "33": "color: #e5e510;",  # yellow
-            "34": "color: #0451a5;",  # blue
-            "35": "color: #bc05bc;",  # magenta
-            "36": "color: #0598bc;",  # cyan
-            "37": "color: #ffffff;",  # white
-            "90": "color: #666666;",  # bright black (gray)
-            "91": "color: #f14c4c;",  # bright red
-            "92": "color: #23d18b;",  # bright green
-            "93": "color: #f5f543;",  # bright yellow
-            "94": "color: #3b8eea;",  # bright blue
-            "95": "color: #d670d6;",  # bright magenta
-            "96": "color: #29b8db;",  # bright cyan
-            "97": "color: #ffffff;",  # bright white
-            "1": "font-weight: bold;",  # bold
-            "0": "",  # reset
-        }
+# Activate the virtual environment
+source .venv/bin/activate
 
-        # Replace ANSI codes with HTML
-        result = text
+# Install syft-client and custom dependencies
+uv pip install {dependencies}
 
-        # Handle reset codes first
-        result = re.sub(r"\x1b\[0m", "</span>", result)
+# Execute the Python file directly from job root
+python {entry_point}
+"""
 
-        # Handle color codes
-        for code, style in ansi_colors.items():
-            if style:  # Skip empty styles (like reset)
-                pattern = rf"\x1b\[{code}m"
-                replacement = f'<span style="{style}">'
-                result = re.sub(pattern, replacement, result)
 
-        # Handle any remaining unclosed spans by adding a closing span at the end
-        if "<span" in result and result.count("<span") > result.count("</span>"):
-            result += "</span>"
+def _default_job_name() -> str:
+    """Generate a default job name of the form "Job - <random_id>"."""
+    # Same 8 hex characters as a truncated uuid4, without building a UUID
+    random_id = os.urandom(4).hex()
+    return f"Job - {random_id}"
 
-        return result
 
-    def __str__(self) -> str:
-        """Return the stdout content with ANSI codes stripped."""
-        if self.job_info.status != "done":
-            return "No stdout available - job not completed yet"
+# ioctl request for copy-on-write file clones on Linux (btrfs, XFS, ...)
+_FICLONE = 0x40049409
 
-        stdout_file = self.job_info.location / "stdout.txt"
 
-        if not stdout_file.exists():
-            return "No stdout file found"
+def _clone_or_copy(src: str | Path, dst: str | Path) -> str | Path:
+    """
+    Copy a file with metadata, cloning it copy-on-write when supported.
 
+    A clone shares the source's data blocks, so the copy is a metadata-only
+    operation regardless of file size. Falls back to shutil.copy2 when the
+    platform or filesystem does not support cloning. Returns dst, so it can be
+    used as the copy_function of shutil.copytree.
+    """
+    if fcntl is not None and sys.platform == "linux":
         try:
-            with open(stdout_file, "r") as f:
-                content = f.read()
-                return self._strip_ansi_codes(content)
-        except Exception as e:
-            return f"Error reading stdout file: {e}"
-
-    def __repr__(self) -> str:
-        """Return a brief representation."""
-        content = str(self)
-        if content.startswith("No stdout") or content.startswith("Error"):
-            return content
-
-        lines = content.split("\n")
-        if len(lines) <= 3:
-            return content
-        else:
-            return f"StdoutViewer({len(lines)} lines, {len(content)} chars)"
-
-    def _repr_html_(self) -> str:
-        """HTML representation for Jupyter notebooks with scrollable view."""
-        # Get raw content first to check for errors
-        if self.job_info.status != "done":
-            error_msg = "No stdout available - job not completed yet"
-        else:
-            stdout_file = self.job_info.location / "stdout.txt"
-
-            if not stdout_file.exists():
-                error_msg = "No stdout file found"
-            else:
-                try:
-                    with open(stdout_file, "r") as f:
-                        raw_content = f.read()
-                    error_msg = None
-                except Exception as e:
-                    error_msg = f"Error reading stdout file: {e}"
-
-        # If no content or error, show a simple message
-        if error_msg:
-            return f"""
-            <style>
-                .syftjob-stdout-empty {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    padding: 20px;
-                    text-align: center;
-                    border-radius: 8px;
-                    background: #f8f9fa;
-                    border: 2px dashed #dee2e6;
-                    color: #6c757d;
-                    font-style: italic;
-                }}
-            </style>
-            <div class="syftjob-stdout-empty">
-                📄 {error_msg}
-            </div>
-            """
-
-        # Convert ANSI codes to HTML for display
-        html_content = self._convert_ansi_to_html(raw_content)
-
-        # Escape any remaining HTML characters that aren't our color spans
-        # We need to be careful not to escape our intentional HTML
-        html_content = (
-            html_content.replace("&", "&amp;")
-            .replace('"', "&quot;")
-            .replace("'", "&#x27;")
-        )
-        # Don't escape < and > since we want our HTML spans to work
-
-        # Count lines and characters (use clean content for stats)
-        clean_content = self._strip_ansi_codes(raw_content)
-        lines = clean_content.split("\n")
-        char_count = len(clean_content)
-        line_count = len(lines)
-
-        return f"""
-        <style>
-            .syftjob-stdout-container {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                overflow: hidden;
-                background: white;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                max-width: 100%;
-                margin: 16px 0;
-            }}
-
-            .syftjob-stdout-header {{
-                background: linear-gradient(135deg, #4299e1 0%, #3182ce 100%);
-                color: white;
-                padding: 12px 16px;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                font-weight: 600;
-            }}
-
-            .syftjob-stdout-title {{
-                display: flex;
-                align-items: center;
-                gap: 8px;
-                font-size: 14px;
-            }}
-
-            .syftjob-stdout-stats {{
-                font-size: 12px;
-                opacity: 0.9;
-                display: flex;
-                gap: 16px;
-            }}
-
-            .syftjob-stdout-content {{
-                background: #f7fafc;
-                border: 1px solid #e2e8f0;
-                font-family: 'Monaco', 'Menlo', 'SF Mono', monospace;
-                font-size: 12px;
-                color: #2d3748;
-                padding: 16px;
-                overflow: auto;
-                white-space: pre-wrap;
-                word-wrap: break-word;
-                max-height: 400px;
-                line-height: 1.5;
-                margin: 0;
-            }}
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
 
-            .syftjob-stdout-content::-webkit-scrollbar {{
-                width: 8px;
-                height: 8px;
-            }}
+    shutil.copy2(src, dst)
+    return dst
 
-            .syftjob-stdout-content::-webkit-scrollbar-track {{
-                background: #f1f1f1;
-                border-radius: 4px;
-            }}
 
-            .syftjob-stdout-content::-webkit-scrollbar-thumb {{
-                background: #c1c1c1;
-                border-radius: 4px;
-            }}
+def _iter_subdirs(path: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield the subdirectories of path, or nothing if path does not exist.
 
-            .syftjob-stdout-content::-webkit-scrollbar-thumb:hover {{
-                background: #a1a1a1;
-            }}
+    Uses os.scandir, whose entries answer is_dir() from the directory listing
+    itself on most filesystems instead of a stat call per entry.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield entry
+    except FileNotFoundError:
+        return
 
-            /* Dark theme */
-            @media (prefers-color-scheme: dark) {{
-                .syftjob-stdout-container {{
-                    background: #1a202c;
-                    border-color: #4a5568;
-                }}
 
-                .syftjob-stdout-header {{
-                    background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
-                }}
+# Default number of threads submit_bash_jobs writes job directories with.
+# Writing is I/O-bound, so this follows ThreadPoolExecutor's own default of
+# a few threads more than the CPU count instead of a fixed number
+_DEFAULT_SUBMIT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
-                .syftjob-stdout-content {{
-                    background: #2d3748;
-                    border-color: #4a5568;
-                    color: #e2e8f0;
-                }}
 
-                .syftjob-stdout-content::-webkit-scrollbar-track {{
-                    background: #2d3748;
-                }}
+def _write_run_script(path: Path, script: str) -> None:
+    """
+    Write a new executable run.sh.
 
-                .syftjob-stdout-content::-webkit-scrollbar-thumb {{
-                    background: #4a5568;
-                }}
+    The file is created with mode 0o755 and its contents written through the
+    same descriptor, so it is never visible without the executable bit and no
+    separate chmod by path is needed. O_EXCL refuses to overwrite an existing
+    script.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+    with os.fdopen(fd, "w") as f:
+        # Enforce the mode even under a restrictive umask
+        if hasattr(os, "fchmod"):
+            os.fchmod(f.fileno(), 0o755)
+        f.write(script)
 
-                .syftjob-stdout-content::-webkit-scrollbar-thumb:hover {{
-                    background: #718096;
-                }}
-            }}
 
-            /* Jupyter dark theme */
-            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-stdout-container,
-            body[data-jp-theme-light="false"] .syftjob-stdout-container {{
-                background: #1a202c;
-                border-color: #4a5568;
-            }}
+# Maximum number of job rows rendered by JobsList; larger lists are truncated
+# so notebook output stays responsive
+_MAX_DISPLAY_ROWS = 200
 
-            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-stdout-header,
-            body[data-jp-theme-light="false"] .syftjob-stdout-header {{
-                background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
-            }}
+# Display emoji per job status ("❓" is used for anything else)
+_STATUS_EMOJIS = {"inbox": "📥", "approved": "✅", "done": "🎉"}
 
-            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-stdout-content,
-            body[data-jp-theme-light="false"] .syftjob-stdout-content {{
-                background: #2d3748;
-                border-color: #4a5568;
-                color: #e2e8f0;
-            }}
-        </style>
+# Order of statuses when sorting jobs that were submitted at the same time
+_STATUS_PRIORITY = {"inbox": 1, "approved": 2, "done": 3}
 
-        <div class="syftjob-stdout-container">
-            <div class="syftjob-stdout-header">
-                <div class="syftjob-stdout-title">
-                    📄 stdout.txt
-                </div>
-                <div class="syftjob-stdout-stats">
-                    <span>{line_count} lines</span>
-                    <span>{char_count:,} chars</span>
-                </div>
-            </div>
-            <pre class="syftjob-stdout-content">{html_content}</pre>
-        </div>
-        """
 
+class _OutputViewer:
+    """Base viewer for a job output file with scrollable display in Jupyter notebooks."""
 
-class StderrViewer:
-    """A viewer for stderr content with scrollable display in Jupyter notebooks."""
+    # Set by subclasses: output stream name, title icon and header background
+    _stream = ""
+    _title_icon = ""
+    _header_background = ""
 
     def __init__(self, job_info: "JobInfo"):
         self.job_info = job_info
@@ -341,57 +194,55 @@ class StderrViewer:
         return result
 
     def __str__(self) -> str:
-        """Return the stderr content with ANSI codes stripped."""
+        """Return the output content with ANSI codes stripped."""
         if self.job_info.status != "done":
-            return "No stderr available - job not completed yet"
-
-        stderr_file = self.job_info.location / "stderr.txt"
+            return f"No {self._stream} available - job not completed yet"
 
-        if not stderr_file.exists():
-            return "No stderr file found"
+        output_file = self.job_info.location / f"{self._stream}.txt"
 
         try:
-            with open(stderr_file, "r") as f:
+            with open(output_file, "r") as f:
                 content = f.read()
                 return self._strip_ansi_codes(content)
+        except FileNotFoundError:
+            return f"No {self._stream} file found"
         except Exception as e:
-            return f"Error reading stderr file: {e}"
+            return f"Error reading {self._stream} file: {e}"
 
     def __repr__(self) -> str:
         """Return a brief representation."""
         content = str(self)
-        if content.startswith("No stderr") or content.startswith("Error"):
+        if content.startswith(f"No {self._stream}") or content.startswith("Error"):
             return content
 
         lines = content.split("\n")
         if len(lines) <= 3:
             return content
         else:
-            return f"StderrViewer({len(lines)} lines, {len(content)} chars)"
+            return f"{type(self).__name__}({len(lines)} lines, {len(content)} chars)"
 
     def _repr_html_(self) -> str:
         """HTML representation for Jupyter notebooks with scrollable view."""
         # Get raw content first to check for errors
         if self.job_info.status != "done":
-            error_msg = "No stderr available - job not completed yet"
+            error_msg = f"No {self._stream} available - job not completed yet"
         else:
-            stderr_file = self.job_info.location / "stderr.txt"
+            output_file = self.job_info.location / f"{self._stream}.txt"
 
-            if not stderr_file.exists():
-                error_msg = "No stderr file found"
-            else:
-                try:
-                    with open(stderr_file, "r") as f:
-                        raw_content = f.read()
-                    error_msg = None
-                except Exception as e:
-                    error_msg = f"Error reading stderr file: {e}"
+            try:
+                with open(output_file, "r") as f:
+                    raw_content = f.read()
+                error_msg = None
+            except FileNotFoundError:
+                error_msg = f"No {self._stream} file found"
+            except Exception as e:
+                error_msg = f"Error reading {self._stream} file: {e}"
 
         # If no content or error, show a simple message
         if error_msg:
             return f"""
             <style>
-                .syftjob-stderr-empty {{
+                .syftjob-{self._stream}-empty {{
                     font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
                     padding: 20px;
                     text-align: center;
@@ -402,7 +253,7 @@ class StderrViewer:
                     font-style: italic;
                 }}
             </style>
-            <div class="syftjob-stderr-empty">
+            <div class="syftjob-{self._stream}-empty">
                 📄 {error_msg}
             </div>
             """
@@ -427,7 +278,7 @@ class StderrViewer:
 
         return f"""
         <style>
-            .syftjob-stderr-container {{
+            .syftjob-{self._stream}-container {{
                 font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
                 border: 1px solid #e2e8f0;
                 border-radius: 8px;
@@ -438,8 +289,8 @@ class StderrViewer:
                 margin: 16px 0;
             }}
 
-            .syftjob-stderr-header {{
-                background: linear-gradient(135deg, #e53e3e 0%, #c53030 100%);
+            .syftjob-{self._stream}-header {{
+                background: {self._header_background};
                 color: white;
                 padding: 12px 16px;
                 display: flex;
@@ -448,21 +299,21 @@ class StderrViewer:
                 font-weight: 600;
             }}
 
-            .syftjob-stderr-title {{
+            .syftjob-{self._stream}-title {{
                 display: flex;
                 align-items: center;
                 gap: 8px;
                 font-size: 14px;
             }}
 
-            .syftjob-stderr-stats {{
+            .syftjob-{self._stream}-stats {{
                 font-size: 12px;
                 opacity: 0.9;
                 display: flex;
                 gap: 16px;
             }}
 
-            .syftjob-stderr-content {{
+            .syftjob-{self._stream}-content {{
                 background: #f7fafc;
                 border: 1px solid #e2e8f0;
                 font-family: 'Monaco', 'Menlo', 'SF Mono', monospace;
@@ -477,93 +328,122 @@ class StderrViewer:
                 margin: 0;
             }}
 
-            .syftjob-stderr-content::-webkit-scrollbar {{
+            .syftjob-{self._stream}-content::-webkit-scrollbar {{
                 width: 8px;
                 height: 8px;
             }}
 
-            .syftjob-stderr-content::-webkit-scrollbar-track {{
+            .syftjob-{self._stream}-content::-webkit-scrollbar-track {{
                 background: #f1f1f1;
                 border-radius: 4px;
             }}
 
-            .syftjob-stderr-content::-webkit-scrollbar-thumb {{
+            .syftjob-{self._stream}-content::-webkit-scrollbar-thumb {{
                 background: #c1c1c1;
                 border-radius: 4px;
             }}
 
-            .syftjob-stderr-content::-webkit-scrollbar-thumb:hover {{
+            .syftjob-{self._stream}-content::-webkit-scrollbar-thumb:hover {{
                 background: #a1a1a1;
             }}
 
             /* Dark theme */
             @media (prefers-color-scheme: dark) {{
-                .syftjob-stderr-container {{
+                .syftjob-{self._stream}-container {{
                     background: #1a202c;
                     border-color: #4a5568;
                 }}
 
-                .syftjob-stderr-header {{
+                .syftjob-{self._stream}-header {{
                     background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
                 }}
 
-                .syftjob-stderr-content {{
+                .syftjob-{self._stream}-content {{
                     background: #2d3748;
                     border-color: #4a5568;
                     color: #e2e8f0;
                 }}
 
-                .syftjob-stderr-content::-webkit-scrollbar-track {{
+                .syftjob-{self._stream}-content::-webkit-scrollbar-track {{
                     background: #2d3748;
                 }}
 
-                .syftjob-stderr-content::-webkit-scrollbar-thumb {{
+                .syftjob-{self._stream}-content::-webkit-scrollbar-thumb {{
                     background: #4a5568;
                 }}
 
-                .syftjob-stderr-content::-webkit-scrollbar-thumb:hover {{
+                .syftjob-{self._stream}-content::-webkit-scrollbar-thumb:hover {{
                     background: #718096;
                 }}
             }}
 
             /* Jupyter dark theme */
-            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-stderr-container,
-            body[data-jp-theme-light="false"] .syftjob-stderr-container {{
+            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-{self._stream}-container,
+            body[data-jp-theme-light="false"] .syftjob-{self._stream}-container {{
                 background: #1a202c;
                 border-color: #4a5568;
             }}
 
-            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-stderr-header,
-            body[data-jp-theme-light="false"] .syftjob-stderr-header {{
+            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-{self._stream}-header,
+            body[data-jp-theme-light="false"] .syftjob-{self._stream}-header {{
                 background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
             }}
 
-            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-stderr-content,
-            body[data-jp-theme-light="false"] .syftjob-stderr-content {{
+            .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-{self._stream}-content,
+            body[data-jp-theme-light="false"] .syftjob-{self._stream}-content {{
                 background: #2d3748;
                 border-color: #4a5568;
                 color: #e2e8f0;
             }}
         </style>
 
-        <div class="syftjob-stderr-container">
-            <div class="syftjob-stderr-header">
-                <div class="syftjob-stderr-title">
-                    🚨 stderr.txt
+        <div class="syftjob-{self._stream}-container">
+            <div class="syftjob-{self._stream}-header">
+                <div class="syftjob-{self._stream}-title">
+                    {self._title_icon} {self._stream}.txt
                 </div>
-                <div class="syftjob-stderr-stats">
+                <div class="syftjob-{self._stream}-stats">
                     <span>{line_count} lines</span>
                     <span>{char_count:,} chars</span>
                 </div>
             </div>
-            <pre class="syftjob-stderr-content">{html_content}</pre>
+            <pre class="syftjob-{self._stream}-content">{html_content}</pre>
         </div>
         """
 
 
+class StdoutViewer(_OutputViewer):
+    """A viewer for stdout content with scrollable display in Jupyter notebooks."""
+
+    _stream = "stdout"
+    _title_icon = "📄"
+    _header_background = "linear-gradient(135deg, #4299e1 0%, #3182ce 100%)"
+
+
+class StderrViewer(_OutputViewer):
+    """A viewer for stderr content with scrollable display in Jupyter notebooks."""
+
+    _stream = "stderr"
+    _title_icon = "🚨"
+    _header_background = "linear-gradient(135deg, #e53e3e 0%, #c53030 100%)"
+
+
 class JobInfo:
     """Information about a job with approval capabilities."""
 
+    # Listing a busy datasite creates one JobInfo per job; slots keep each
+    # instance small and attribute access cheap
+    __slots__ = (
+        "name",
+        "user",
+        "status",
+        "submitted_by",
+        "location",
+        "_config",
+        "_root_email",
+        "submitted_at",
+    )
+
     def __init__(
         self,
         name: str,
@@ -585,8 +465,7 @@ class JobInfo:
         self.submitted_at = submitted_at
 
     def __str__(self) -> str:
-        status_emojis = {"inbox": "📥", "approved": "✅", "done": "🎉"}
-        emoji = status_emojis.get(self.status, "❓")
+        emoji = _STATUS_EMOJIS.get(self.status, "❓")
         return f"{emoji} {self.name} ({self.status}) -> {self.user}"
 
     def __repr__(self) -> str:
@@ -614,8 +493,11 @@ class JobInfo:
             )
 
         result_path = Path(path)
-        if not result_path.exists():
-            raise FileNotFoundError(f"Result path not found: {path}")
+        # A single stat answers both "does it exist" and "file or folder"
+        try:
+            result_mode = os.stat(result_path).st_mode
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Result path not found: {path}") from None
 
         # Create outputs directory in the job directory
         outputs_dir = self.location / "outputs"
@@ -625,12 +507,12 @@ class JobInfo:
         result_name = result_path.name
         destination = outputs_dir / result_name
 
-        if result_path.is_file():
-            # Copy file to outputs directory
-            shutil.copy2(str(result_path), str(destination))
-        elif result_path.is_dir():
+        if stat.S_ISREG(result_mode):
+            # Copy file to outputs directory (cloned when the filesystem allows)
+            _clone_or_copy(result_path, destination)
+        elif stat.S_ISDIR(result_mode):
             # Copy entire directory to outputs directory
-            shutil.copytree(str(result_path), str(destination))
+            shutil.copytree(result_path, destination, copy_function=_clone_or_copy)
         else:
             raise ValueError(f"Path is neither a file nor a directory: {path}")
 
@@ -836,8 +718,6 @@ class JobInfo:
         )
 
         # Apply syntax highlighting
-        import re
-
         # Comments (lines starting with #)
         code = re.sub(
             r"(#.*)",
@@ -885,12 +765,8 @@ class JobInfo:
         try:
             config_file = self.location / "config.yaml"
             if config_file.exists():
-                from datetime import datetime
-
-                import yaml
-
                 with open(config_file, "r") as f:
-                    config_data = yaml.safe_load(f)
+                    config_data = yaml.load(f, Loader=_SafeLoader)
                     job_type = config_data.get("type", "bash")
                     submitted_at = config_data.get("submitted_at")
 
@@ -905,15 +781,11 @@ class JobInfo:
                             submitted_time = str(submitted_at)
                     else:
                         # Fallback to file modification time
-                        import os
-
                         mtime = os.path.getmtime(config_file)
                         dt = datetime.fromtimestamp(mtime)
                         submitted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
             else:
                 # If no config file, use job directory modification time
-                import os
-
                 if self.location.exists():
                     mtime = os.path.getmtime(self.location)
                     dt = datetime.fromtimestamp(mtime)
@@ -966,7 +838,7 @@ class JobInfo:
                     code_section = f"""
                 <div class="syftjob-single-section">
                     <h4>🐍 Code</h4>
-                    <div class="syftjob-single-filename">{py_file.name}</div>
+                    <div class="syftjob-single-filename">{html.escape(py_file.name)}</div>
                     <div class="syftjob-single-code">{highlighted_content}</div>
                 </div>"""
             except Exception:
@@ -979,7 +851,7 @@ class JobInfo:
             if output_files:
                 outputs_items = "\n".join(
                     [
-                        f'                        <div class="syftjob-single-outputs-item">📄 {path.name}</div>'
+                        f'                        <div class="syftjob-single-outputs-item">📄 {html.escape(path.name)}</div>'
                         for path in output_files
                     ]
                 )
@@ -1181,7 +1053,7 @@ class JobInfo:
         </style>
         <div class="syftjob-single">
             <div class="syftjob-single-header">
-                <h3 class="syftjob-single-title">📋 {self.name}</h3>
+                <h3 class="syftjob-single-title">📋 {html.escape(self.name)}</h3>
                 <span class="syftjob-single-status-{self.status}">
                     {'📥' if self.status == 'inbox' else '✅' if self.status == 'approved' else '🎉'} {self.status.upper()}
                 </span>
@@ -1190,19 +1062,19 @@ class JobInfo:
                 <div class="syftjob-single-details">
                     <div class="syftjob-single-detail">
                         <div class="syftjob-single-detail-label">User:</div>
-                        <div class="syftjob-single-detail-value">{self.user}</div>
+                        <div class="syftjob-single-detail-value">{html.escape(self.user)}</div>
                     </div>
                     <div class="syftjob-single-detail">
                         <div class="syftjob-single-detail-label">Submitted by:</div>
-                        <div class="syftjob-single-detail-value">{self.submitted_by}</div>
+                        <div class="syftjob-single-detail-value">{html.escape(self.submitted_by)}</div>
                     </div>
                     <div class="syftjob-single-detail">
                         <div class="syftjob-single-detail-label">Location:</div>
-                        <div class="syftjob-single-detail-value">{self.location}</div>
+                        <div class="syftjob-single-detail-value">{html.escape(str(self.location))}</div>
                     </div>
                     <div class="syftjob-single-detail">
                         <div class="syftjob-single-detail-label">Submitted:</div>
-                        <div class="syftjob-single-detail-value">{submitted_time}</div>
+                        <div class="syftjob-single-detail-value">{html.escape(submitted_time)}</div>
                     </div>
                 </div>
                 <div class="syftjob-single-section">
@@ -1214,6 +1086,330 @@ class JobInfo:
         """
 
 
+# Static markup for JobsList._repr_html_, kept out of the method so each
+# render only formats the per-job parts
+_JOBS_EMPTY_STATE_HTML = """
+<style>
+
+    .syftjob-empty {
+        padding: 30px 20px;
+        text-align: center;
+        border-radius: 8px;
+        background: linear-gradient(135deg, #f8c073 0%, #f79763 50%, #cc677b 100%);
+        border: 1px solid rgba(248,192,115,0.2);
+        color: white;
+    }
+
+
+    .syftjob-empty h3 {
+        margin: 0 0 12px 0;
+        font-size: 18px;
+        color: white;
+        font-weight: 600;
+    }
+
+    .syftjob-empty p {
+        margin: 0;
+        color: rgba(255,255,255,0.9);
+        font-size: 16px;
+        opacity: 0.95;
+    }
+
+    .syftjob-empty-icon {
+        font-size: 24px;
+        margin-bottom: 12px;
+        display: block;
+    }
+
+    /* Dark theme */
+    @media (prefers-color-scheme: dark) {
+        .syftjob-empty {
+            background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
+            border-color: rgba(74,85,104,0.2);
+        }
+        .syftjob-empty h3 {
+            color: white;
+        }
+        .syftjob-empty p {
+            color: rgba(255,255,255,0.95);
+            opacity: 0.95;
+        }
+    }
+
+    /* Jupyter dark theme detection */
+    .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-empty,
+    body[data-jp-theme-light="false"] .syftjob-empty {
+        background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
+        border-color: rgba(74,85,104,0.2);
+    }
+    .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-empty h3,
+    body[data-jp-theme-light="false"] .syftjob-empty h3 {
+        color: white;
+    }
+    .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-empty p,
+    body[data-jp-theme-light="false"] .syftjob-empty p {
+        color: rgba(255,255,255,0.95);
+        opacity: 0.95;
+    }
+</style>
+<div class="syftjob-empty">
+    <span class="syftjob-empty-icon">📭</span>
+    <h3>No jobs found</h3>
+    <p>Submit jobs to see them here</p>
+</div>
+"""
+
+_JOBS_TABLE_CSS = """
+<style>
+    .syftjob-overview {
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        margin: 16px 0;
+        font-size: 14px;
+    }
+
+    .syftjob-global-header {
+        background: #1F2937;
+        color: white;
+        padding: 12px 16px;
+        border: 2px solid #111827;
+        text-align: center;
+        margin-bottom: 16px;
+    }
+
+    .syftjob-global-header h3 {
+        margin: 0 0 4px 0;
+        font-size: 16px;
+        font-weight: 700;
+    }
+    .syftjob-global-header p {
+        margin: 0;
+        font-size: 13px;
+        font-weight: 500;
+    }
+
+    .syftjob-user-section {
+        margin-bottom: 24px;
+        border: 2px solid #9CA3AF;
+    }
+
+    .syftjob-user-header {
+        background: #F3F4F6;
+        border-bottom: 2px solid #9CA3AF;
+        padding: 8px 12px;
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+    }
+
+    .syftjob-user-header h4 {
+        margin: 0;
+        font-size: 14px;
+        font-weight: 700;
+        color: #111827;
+    }
+
+    .syftjob-user-summary {
+        font-size: 12px;
+        color: #374151;
+        font-weight: 600;
+    }
+
+    .syftjob-table {
+        width: 100%;
+        border-collapse: collapse;
+        background: white;
+        font-size: 13px;
+        border: 2px solid #6B7280;
+    }
+
+    .syftjob-thead {
+        background: #E5E7EB;
+    }
+    .syftjob-th {
+        padding: 8px 12px;
+        text-align: left;
+        font-weight: 700;
+        color: #111827;
+        border-right: 2px solid #6B7280;
+        border-bottom: 2px solid #6B7280;
+    }
+    .syftjob-th:last-child { border-right: none; }
+
+    .syftjob-row-even {
+        background: #FFFFFF;
+    }
+    .syftjob-row-odd {
+        background: #F9FAFB;
+    }
+    .syftjob-row {
+        border-bottom: 1px solid #9CA3AF;
+    }
+    .syftjob-row:hover {
+        background: #DBEAFE !important;
+    }
+
+    .syftjob-td {
+        padding: 8px 12px;
+        border-right: 1px solid #9CA3AF;
+        vertical-align: middle;
+    }
+    .syftjob-td:last-child { border-right: none; }
+
+    .syftjob-index {
+        background: #D1D5DB;
+        padding: 4px 8px;
+        border-radius: 3px;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 11px;
+        font-weight: 700;
+        color: #111827;
+        border: 2px solid #6B7280;
+        display: inline-block;
+        min-width: 24px;
+        text-align: center;
+    }
+
+    .syftjob-job-name {
+        font-weight: 600;
+        color: #111827;
+    }
+
+    .syftjob-status-inbox {
+        background: #FBBF24;
+        color: #451A03;
+        padding: 3px 8px;
+        border: 2px solid #B45309;
+        border-radius: 3px;
+        font-size: 11px;
+        font-weight: 700;
+        display: inline-block;
+    }
+
+    .syftjob-status-approved {
+        background: #60A5FA;
+        color: #1E3A8A;
+        padding: 3px 8px;
+        border: 2px solid #1D4ED8;
+        border-radius: 3px;
+        font-size: 11px;
+        font-weight: 700;
+        display: inline-block;
+    }
+
+    .syftjob-status-done {
+        background: #34D399;
+        color: #064E3B;
+        padding: 3px 8px;
+        border: 2px solid #047857;
+        border-radius: 3px;
+        font-size: 11px;
+        font-weight: 700;
+        display: inline-block;
+    }
+
+    .syftjob-submitted {
+        color: #374151;
+        font-size: 12px;
+        font-weight: 600;
+    }
+
+    .syftjob-global-footer {
+        background: #F3F4F6;
+        padding: 12px 16px;
+        text-align: center;
+        border: 2px solid #9CA3AF;
+        margin-top: 16px;
+    }
+
+    .syftjob-global-summary {
+        display: flex;
+        justify-content: center;
+        gap: 16px;
+        margin-bottom: 12px;
+        flex-wrap: wrap;
+    }
+
+    .syftjob-summary-item {
+        display: inline-block;
+        font-size: 12px;
+        color: #111827;
+        padding: 4px 8px;
+        background: white;
+        border: 2px solid #6B7280;
+        border-radius: 3px;
+        font-weight: 600;
+    }
+
+    .syftjob-hint {
+        font-size: 12px;
+        color: #374151;
+        line-height: 1.4;
+        margin-top: 8px;
+        font-weight: 500;
+    }
+
+    .syftjob-code {
+        background: #E5E7EB;
+        padding: 2px 4px;
+        border-radius: 3px;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 11px;
+        border: 2px solid #6B7280;
+        font-weight: 600;
+        color: #111827;
+    }
+
+</style>
+"""
+
+# One job row of the JobsList HTML table, filled in with str.format
+_JOBS_ROW_TEMPLATE = """
+<tr class="{row_class} syftjob-row">
+    <td class="syftjob-td">
+        <span class="syftjob-index">[{job_index}]</span>
+    </td>
+    <td class="syftjob-td syftjob-job-name">
+        {name}
+    </td>
+    <td class="syftjob-td syftjob-submitted">
+        {submitted_by}
+    </td>
+    <td class="syftjob-td">
+        <span class="syftjob-status-{status}">
+            {emoji} {status_upper}
+        </span>
+    </td>
+</tr>
+"""
+
+
+# Row that stands in for the jobs beyond _MAX_DISPLAY_ROWS
+_JOBS_HIDDEN_ROW_TEMPLATE = """
+<tr class="syftjob-row">
+    <td class="syftjob-td" colspan="4">
+        ... {hidden} more jobs hidden
+    </td>
+</tr>
+"""
+
+
+def _status_row_template(status: str, emoji: str) -> str:
+    """Return _JOBS_ROW_TEMPLATE with the status-specific fields filled in."""
+    return (
+        _JOBS_ROW_TEMPLATE.replace("{status}", status)
+        .replace("{emoji}", emoji)
+        .replace("{status_upper}", status.upper())
+    )
+
+
+# Row templates for the known statuses, specialized once at import time so a
+# render only formats the per-job fields
+_JOBS_ROW_TEMPLATES = {
+    status: _status_row_template(status, emoji)
+    for status, emoji in _STATUS_EMOJIS.items()
+}
+
+
 class JobsList:
     """A list-like container for JobInfo objects with nice display."""
 
@@ -1230,28 +1426,21 @@ class JobsList:
     def __iter__(self):
         return iter(self._jobs)
 
-    def __str__(self) -> str:
-        """Format jobs list as separate tables grouped by user."""
-        if not self._jobs:
-            return "📭 No jobs found.\n"
+    @cached_property
+    def _jobs_by_user(self) -> List[Tuple[str, List[JobInfo]]]:
+        """Jobs grouped by user, root user first and the others alphabetically.
 
-        # Group jobs by user
+        Computed once and shared by __str__ and _repr_html_, which notebooks
+        typically call back to back. Only the grouping is cached: job.user never
+        changes, but job.status does (approve(), accept_by_depositing_result(),
+        rerun()), so status counts are recounted on every render.
+        """
         jobs_by_user: dict[str, list[JobInfo]] = {}
         for job in self._jobs:
             if job.user not in jobs_by_user:
                 jobs_by_user[job.user] = []
             jobs_by_user[job.user].append(job)
 
-        # Status emojis
-        status_emojis = {"inbox": "📥", "approved": "✅", "done": "🎉"}
-
-        lines = []
-        lines.append("📊 Jobs Overview")
-        lines.append("=" * 50)
-
-        total_jobs = 0
-        global_status_counts: dict[str, int] = {}
-
         # Sort users with root user first, then alphabetically
         def user_sort_key(item):
             user_email, user_jobs = item
@@ -1259,7 +1448,19 @@ class JobsList:
                 return (0, user_email)  # Root user comes first
             return (1, user_email)  # Others sorted alphabetically
 
-        sorted_users = sorted(jobs_by_user.items(), key=user_sort_key)
+        return sorted(jobs_by_user.items(), key=user_sort_key)
+
+    def __str__(self) -> str:
+        """Format jobs list as separate tables grouped by user."""
+        if not self._jobs:
+            return "📭 No jobs found.\n"
+
+        lines = []
+        lines.append("📊 Jobs Overview")
+        lines.append("=" * 50)
+
+        total_jobs = 0
+        sorted_users = self._jobs_by_user
 
         # Create a global job index that matches HTML display
         job_index = 0
@@ -1275,47 +1476,48 @@ class JobsList:
             lines.append(f"👤 {user_email}")
             lines.append("-" * 60)
 
-            # Calculate column widths for this user's jobs
-            name_width = max(len(job.name) for job in user_jobs) + 2
-            status_width = max(len(job.status) for job in user_jobs) + 2
-            submitted_width = max(len(job.submitted_by) for job in user_jobs) + 2
-
-            # Ensure minimum widths
-            name_width = max(name_width, 15)
-            status_width = max(status_width, 12)
-            submitted_width = max(submitted_width, 15)
+            # Only render rows up to the display cap; the rest are summarized
+            shown_jobs = user_jobs[: max(_MAX_DISPLAY_ROWS - job_index, 0)]
+            hidden = len(user_jobs) - len(shown_jobs)
+
+            # Calculate column widths for this user's jobs in a single pass,
+            # starting from the minimum widths
+            name_width, status_width, submitted_width = 13, 10, 13
+            for job in shown_jobs:
+                if len(job.name) > name_width:
+                    name_width = len(job.name)
+                if len(job.status) > status_width:
+                    status_width = len(job.status)
+                if len(job.submitted_by) > submitted_width:
+                    submitted_width = len(job.submitted_by)
+            name_width += 2
+            status_width += 2
+            submitted_width += 2
 
             # Header
             header = f"{'Index':<6} {'Job Name':<{name_width}} {'Submitted By':<{submitted_width}} {'Status':<{status_width}}"
             lines.append(header)
             lines.append("-" * len(header))
 
-            # Jobs are already sorted by submission time globally, preserve that order
-            sorted_jobs = user_jobs
-
-            # Job rows with global indexing
-            for job in sorted_jobs:
-                emoji = status_emojis.get(job.status, "❓")
+            # Job rows with global indexing. Jobs are already sorted by
+            # submission time globally, preserve that order
+            for job in shown_jobs:
+                emoji = _STATUS_EMOJIS.get(job.status, "❓")
                 status_display = f"{emoji} {job.status}"
                 line = f"[{job_index:<4}] {job.name:<{name_width}} {job.submitted_by:<{submitted_width}} {status_display:<{status_width}}"
                 lines.append(line)
                 job_index += 1
 
-                # Count for global summary
-                global_status_counts[job.status] = (
-                    global_status_counts.get(job.status, 0) + 1
-                )
+            if hidden:
+                lines.append(f"... {hidden} more jobs hidden")
+                job_index += hidden
 
             # User summary
-            user_status_counts: dict[str, int] = {}
-            for job in user_jobs:
-                user_status_counts[job.status] = (
-                    user_status_counts.get(job.status, 0) + 1
-                )
+            user_status_counts = Counter(job.status for job in user_jobs)
 
             summary_parts = []
             for status, count in user_status_counts.items():
-                emoji = status_emojis.get(status, "❓")
+                emoji = _STATUS_EMOJIS.get(status, "❓")
                 summary_parts.append(f"{emoji} {count} {status}")
 
             lines.append(
@@ -1325,11 +1527,11 @@ class JobsList:
         # Global summary
         lines.append("")
         lines.append("=" * 50)
-        lines.append(f"📈 Total: {total_jobs} jobs across {len(jobs_by_user)} users")
+        lines.append(f"📈 Total: {total_jobs} jobs across {len(sorted_users)} users")
 
         global_summary_parts = []
-        for status, count in global_status_counts.items():
-            emoji = status_emojis.get(status, "❓")
+        for status, count in Counter(job.status for job in self._jobs).items():
+            emoji = _STATUS_EMOJIS.get(status, "❓")
             global_summary_parts.append(f"{emoji} {count} {status}")
 
         if global_summary_parts:
@@ -1348,355 +1550,45 @@ class JobsList:
     def _repr_html_(self) -> str:
         """HTML representation for Jupyter notebooks with enhanced visual appeal."""
         if not self._jobs:
-            return """
-            <style>
-
-                .syftjob-empty {
-                    padding: 30px 20px;
-                    text-align: center;
-                    border-radius: 8px;
-                    background: linear-gradient(135deg, #f8c073 0%, #f79763 50%, #cc677b 100%);
-                    border: 1px solid rgba(248,192,115,0.2);
-                    color: white;
-                }
-
-
-                .syftjob-empty h3 {
-                    margin: 0 0 12px 0;
-                    font-size: 18px;
-                    color: white;
-                    font-weight: 600;
-                }
-
-                .syftjob-empty p {
-                    margin: 0;
-                    color: rgba(255,255,255,0.9);
-                    font-size: 16px;
-                    opacity: 0.95;
-                }
-
-                .syftjob-empty-icon {
-                    font-size: 24px;
-                    margin-bottom: 12px;
-                    display: block;
-                }
-
-                /* Dark theme */
-                @media (prefers-color-scheme: dark) {
-                    .syftjob-empty {
-                        background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
-                        border-color: rgba(74,85,104,0.2);
-                    }
-                    .syftjob-empty h3 {
-                        color: white;
-                    }
-                    .syftjob-empty p {
-                        color: rgba(255,255,255,0.95);
-                        opacity: 0.95;
-                    }
-                }
-
-                /* Jupyter dark theme detection */
-                .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-empty,
-                body[data-jp-theme-light="false"] .syftjob-empty {
-                    background: linear-gradient(135deg, #2d3748 0%, #4a5568 100%);
-                    border-color: rgba(74,85,104,0.2);
-                }
-                .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-empty h3,
-                body[data-jp-theme-light="false"] .syftjob-empty h3 {
-                    color: white;
-                }
-                .jp-RenderedHTMLCommon[data-jp-theme-light="false"] .syftjob-empty p,
-                body[data-jp-theme-light="false"] .syftjob-empty p {
-                    color: rgba(255,255,255,0.95);
-                    opacity: 0.95;
-                }
-            </style>
-            <div class="syftjob-empty">
-                <span class="syftjob-empty-icon">📭</span>
-                <h3>No jobs found</h3>
-                <p>Submit jobs to see them here</p>
-            </div>
-            """
+            return _JOBS_EMPTY_STATE_HTML
 
-        # Group jobs by user
-        jobs_by_user: dict[str, list[JobInfo]] = {}
-        for job in self._jobs:
-            if job.user not in jobs_by_user:
-                jobs_by_user[job.user] = []
-            jobs_by_user[job.user].append(job)
-
-        # Status styling for light and dark themes
-        status_styles = {
-            "inbox": {
-                "emoji": "📥",
-                "light": {"color": "#6976ae", "bg": "#e8f2ff"},
-                "dark": {"color": "#96d195", "bg": "#52a8c5"},
-            },
-            "approved": {
-                "emoji": "✅",
-                "light": {"color": "#53bea9", "bg": "#e6f9f4"},
-                "dark": {"color": "#53bea9", "bg": "#2a5d52"},
-            },
-            "done": {
-                "emoji": "🎉",
-                "light": {"color": "#937098", "bg": "#f3e5f5"},
-                "dark": {"color": "#f2d98c", "bg": "#cc677b"},
-            },
-        }
+        sorted_users = self._jobs_by_user
 
         # Calculate total counts for summary
         total_jobs = len(self._jobs)
-        global_status_counts: dict[str, int] = {}
-        for job in self._jobs:
-            global_status_counts[job.status] = (
-                global_status_counts.get(job.status, 0) + 1
-            )
 
         # Build HTML with clean Excel-like interface
-        html = f"""
-        <style>
-            .syftjob-overview {{
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                margin: 16px 0;
-                font-size: 14px;
-            }}
-
-            .syftjob-global-header {{
-                background: #1F2937;
-                color: white;
-                padding: 12px 16px;
-                border: 2px solid #111827;
-                text-align: center;
-                margin-bottom: 16px;
-            }}
-
-            .syftjob-global-header h3 {{
-                margin: 0 0 4px 0;
-                font-size: 16px;
-                font-weight: 700;
-            }}
-            .syftjob-global-header p {{
-                margin: 0;
-                font-size: 13px;
-                font-weight: 500;
-            }}
-
-            .syftjob-user-section {{
-                margin-bottom: 24px;
-                border: 2px solid #9CA3AF;
-            }}
-
-            .syftjob-user-header {{
-                background: #F3F4F6;
-                border-bottom: 2px solid #9CA3AF;
-                padding: 8px 12px;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-            }}
-
-            .syftjob-user-header h4 {{
-                margin: 0;
-                font-size: 14px;
-                font-weight: 700;
-                color: #111827;
-            }}
-
-            .syftjob-user-summary {{
-                font-size: 12px;
-                color: #374151;
-                font-weight: 600;
-            }}
-
-            .syftjob-table {{
-                width: 100%;
-                border-collapse: collapse;
-                background: white;
-                font-size: 13px;
-                border: 2px solid #6B7280;
-            }}
-
-            .syftjob-thead {{
-                background: #E5E7EB;
-            }}
-            .syftjob-th {{
-                padding: 8px 12px;
-                text-align: left;
-                font-weight: 700;
-                color: #111827;
-                border-right: 2px solid #6B7280;
-                border-bottom: 2px solid #6B7280;
-            }}
-            .syftjob-th:last-child {{ border-right: none; }}
-
-            .syftjob-row-even {{
-                background: #FFFFFF;
-            }}
-            .syftjob-row-odd {{
-                background: #F9FAFB;
-            }}
-            .syftjob-row {{
-                border-bottom: 1px solid #9CA3AF;
-            }}
-            .syftjob-row:hover {{
-                background: #DBEAFE !important;
-            }}
-
-            .syftjob-td {{
-                padding: 8px 12px;
-                border-right: 1px solid #9CA3AF;
-                vertical-align: middle;
-            }}
-            .syftjob-td:last-child {{ border-right: none; }}
-
-            .syftjob-index {{
-                background: #D1D5DB;
-                padding: 4px 8px;
-                border-radius: 3px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                font-weight: 700;
-                color: #111827;
-                border: 2px solid #6B7280;
-                display: inline-block;
-                min-width: 24px;
-                text-align: center;
-            }}
-
-            .syftjob-job-name {{
-                font-weight: 600;
-                color: #111827;
-            }}
-
-            .syftjob-status-inbox {{
-                background: #FBBF24;
-                color: #451A03;
-                padding: 3px 8px;
-                border: 2px solid #B45309;
-                border-radius: 3px;
-                font-size: 11px;
-                font-weight: 700;
-                display: inline-block;
-            }}
-
-            .syftjob-status-approved {{
-                background: #60A5FA;
-                color: #1E3A8A;
-                padding: 3px 8px;
-                border: 2px solid #1D4ED8;
-                border-radius: 3px;
-                font-size: 11px;
-                font-weight: 700;
-                display: inline-block;
-            }}
-
-            .syftjob-status-done {{
-                background: #34D399;
-                color: #064E3B;
-                padding: 3px 8px;
-                border: 2px solid #047857;
-                border-radius: 3px;
-                font-size: 11px;
-                font-weight: 700;
-                display: inline-block;
-            }}
-
-            .syftjob-submitted {{
-                color: #374151;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-
-            .syftjob-global-footer {{
-                background: #F3F4F6;
-                padding: 12px 16px;
-                text-align: center;
-                border: 2px solid #9CA3AF;
-                margin-top: 16px;
-            }}
-
-            .syftjob-global-summary {{
-                display: flex;
-                justify-content: center;
-                gap: 16px;
-                margin-bottom: 12px;
-                flex-wrap: wrap;
-            }}
-
-            .syftjob-summary-item {{
-                display: inline-block;
-                font-size: 12px;
-                color: #111827;
-                padding: 4px 8px;
-                background: white;
-                border: 2px solid #6B7280;
-                border-radius: 3px;
-                font-weight: 600;
-            }}
-
-            .syftjob-hint {{
-                font-size: 12px;
-                color: #374151;
-                line-height: 1.4;
-                margin-top: 8px;
-                font-weight: 500;
-            }}
-
-            .syftjob-code {{
-                background: #E5E7EB;
-                padding: 2px 4px;
-                border-radius: 3px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                border: 2px solid #6B7280;
-                font-weight: 600;
-                color: #111827;
-            }}
-
-        </style>
-
+        parts: List[str] = [_JOBS_TABLE_CSS]
+        parts.append(f"""
         <div class="syftjob-overview">
             <div class="syftjob-global-header">
                 <h3>📊 Jobs Overview</h3>
-                <p>Total: {total_jobs} jobs across {len(jobs_by_user)} users</p>
+                <p>Total: {total_jobs} jobs across {len(sorted_users)} users</p>
             </div>
-        """
+        """)
 
         # Create a separate table for each user that has jobs
-        # Sort users with root user first, then alphabetically
-        def user_sort_key(item):
-            user_email, user_jobs = item
-            if user_email == self._root_email:
-                return (0, user_email)  # Root user comes first
-            return (1, user_email)  # Others sorted alphabetically
-
-        sorted_users = sorted(jobs_by_user.items(), key=user_sort_key)
-
         job_index = 0
         for user_email, user_jobs in sorted_users:
             if not user_jobs:  # Skip users with no jobs
                 continue
 
-            # Jobs are already sorted by submission time globally, preserve that order
-            sorted_user_jobs = user_jobs
+            # Only render rows up to the display cap; the rest are summarized
+            shown_jobs = user_jobs[: max(_MAX_DISPLAY_ROWS - job_index, 0)]
+            hidden = len(user_jobs) - len(shown_jobs)
 
             # Calculate user summary
-            user_status_counts: dict[str, int] = {}
-            for job in user_jobs:
-                user_status_counts[job.status] = (
-                    user_status_counts.get(job.status, 0) + 1
-                )
+            user_status_counts = Counter(job.status for job in user_jobs)
 
             user_summary_parts = []
             for status, count in user_status_counts.items():
-                emoji = status_styles.get(status, {}).get("emoji", "❓")
+                emoji = _STATUS_EMOJIS.get(status, "❓")
                 user_summary_parts.append(f"{emoji} {count} {status}")
 
-            html += f"""
+            parts.append(f"""
             <div class="syftjob-user-section">
                 <div class="syftjob-user-header">
-                    <h4>👤 {user_email}</h4>
+                    <h4>👤 {html.escape(user_email)}</h4>
                     <div class="syftjob-user-summary">{len(user_jobs)} jobs - {" | ".join(user_summary_parts)}</div>
                 </div>
                 <table class="syftjob-table">
@@ -1709,63 +1601,60 @@ class JobsList:
                         </tr>
                     </thead>
                     <tbody>
-            """
-
-            # Add job rows for this user
-            for i, job in enumerate(sorted_user_jobs):
-                style_info = status_styles.get(job.status, {"emoji": "❓"})
+            """)
+
+            # Add job rows for this user. Jobs are already sorted by submission
+            # time globally, preserve that order
+            for i, job in enumerate(shown_jobs):
+                row_template = _JOBS_ROW_TEMPLATES.get(job.status)
+                if row_template is None:
+                    row_template = _status_row_template(job.status, "❓")
                 row_class = "syftjob-row-even" if i % 2 == 0 else "syftjob-row-odd"
 
-                html += f"""
-                        <tr class="{row_class} syftjob-row">
-                            <td class="syftjob-td">
-                                <span class="syftjob-index">[{job_index}]</span>
-                            </td>
-                            <td class="syftjob-td syftjob-job-name">
-                                {job.name}
-                            </td>
-                            <td class="syftjob-td syftjob-submitted">
-                                {job.submitted_by}
-                            </td>
-                            <td class="syftjob-td">
-                                <span class="syftjob-status-{job.status}">
-                                    {style_info['emoji']} {job.status.upper()}
-                                </span>
-                            </td>
-                        </tr>
-                """
+                parts.append(
+                    row_template.format(
+                        row_class=row_class,
+                        job_index=job_index,
+                        name=html.escape(job.name),
+                        submitted_by=html.escape(job.submitted_by),
+                    )
+                )
                 job_index += 1
 
-            html += """
+            if hidden:
+                parts.append(_JOBS_HIDDEN_ROW_TEMPLATE.format(hidden=hidden))
+                job_index += hidden
+
+            parts.append("""
                     </tbody>
                 </table>
             </div>
-            """
+            """)
 
         # Add global summary footer
-        html += """
+        parts.append("""
             <div class="syftjob-global-footer">
                 <div class="syftjob-global-summary">
-        """
+        """)
 
-        for status, count in global_status_counts.items():
-            style_info = status_styles.get(status, {"emoji": "❓"})
-            html += f"""
+        for status, count in Counter(job.status for job in self._jobs).items():
+            emoji = _STATUS_EMOJIS.get(status, "❓")
+            parts.append(f"""
                     <span class="syftjob-summary-item">
-                        {style_info['emoji']} {count} {status}
+                        {emoji} {count} {status}
                     </span>
-            """
+            """)
 
-        html += """
+        parts.append("""
                 </div>
                 <div class="syftjob-hint">
                     💡 Use <code class="syftjob-code">jobs[0].approve()</code> to approve jobs or <code class="syftjob-code">jobs[0].accept_by_depositing_result('file_or_folder')</code> to complete jobs
                 </div>
             </div>
         </div>
-        """
+        """)
 
-        return html
+        return "".join(parts)
 
 
 class JobClient:
@@ -1776,6 +1665,11 @@ class JobClient:
         self.config = config
         self.root_email = config.email  # From SyftBox folder (for "submitted_by")
         self.user_email = user_email or config.email  # Target user for job views
+        # Users whose user and job directories are known to exist
+        self._prepared_users: Set[str] = set()
+        # Parsed config.yaml per path, with the (inode, mtime_ns, size) it was
+        # read at
+        self._config_cache: dict[str, Tuple[Tuple[int, int, int], dict]] = {}
 
         # Validate that user_email exists in SyftBox root
         self._validate_user_email()
@@ -1795,6 +1689,41 @@ class JobClient:
         # Create job directory if it doesn't exist
         job_dir.mkdir(parents=True, exist_ok=True)
 
+    def _prepare_job_root(self, user: str) -> Path:
+        """Ensure the user and job directories exist and return the job directory."""
+        job_root = self.config.get_job_dir(user)
+        # Skip the directory checks for users already prepared by this client.
+        # A job root removed later is recreated by mkdir(parents=True) in
+        # _create_job_dir.
+        if user in self._prepared_users:
+            return job_root
+
+        # Ensure user directory exists (create if it doesn't)
+        user_dir = self.config.get_user_dir(user)
+        if not user_dir.exists():
+            user_dir.mkdir(parents=True, exist_ok=True)
+            print(f"Created user directory: {user_dir}")
+
+        # Ensure job directory structure exists
+        self._ensure_job_directories(user)
+        self._prepared_users.add(user)
+
+        return job_root
+
+    def _create_job_dir(self, job_root: Path, user: str, job_name: str) -> Path:
+        """Create a new job directory, failing if a job with that name exists."""
+        # Create job directory directly in job directory. A single mkdir both
+        # checks for an existing job and creates it, without a race in between.
+        job_dir = job_root / job_name
+        try:
+            job_dir.mkdir(parents=True)
+        except FileExistsError:
+            raise FileExistsError(
+                f"Job '{job_name}' already exists for user '{user}'"
+            ) from None
+
+        return job_dir
+
     def submit_bash_job(self, user: str, script: str, job_name: str = "") -> Path:
         """
         Submit a bash job for a user.
@@ -1811,49 +1740,108 @@ class JobClient:
             FileExistsError: If job with same name already exists
             ValueError: If user directory doesn't exist
         """
-        # Generate default job name if not provided
-        if not job_name.strip():
-            from uuid import uuid4
+        job_root = self._prepare_job_root(user)
+        return self._write_bash_job(job_root, user, script, job_name)
 
-            random_id = str(uuid4())[0:8]
-            job_name = f"Job - {random_id}"
-        # Ensure user directory exists (create if it doesn't)
-        user_dir = self.config.get_user_dir(user)
-        if not user_dir.exists():
-            user_dir.mkdir(parents=True, exist_ok=True)
-            print(f"Created user directory: {user_dir}")
+    def submit_bash_jobs(
+        self,
+        user: str,
+        scripts: List[str],
+        job_names: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Path]:
+        """
+        Submit several bash jobs for a user in one call.
 
-        # Ensure job directory structure exists
-        self._ensure_job_directories(user)
+        The user and job directories are prepared once for the whole batch,
+        so each job only pays for writing its own run.sh and config.yaml.
+        Job directories are written concurrently by a bounded thread pool, which
+        overlaps filesystem latency (e.g. on synced or network-backed folders).
+        The batch is not atomic: if writing one job fails, the jobs already
+        written stay on disk and the error is raised.
 
-        # Create job directory directly in job directory
-        job_dir = self.config.get_job_dir(user) / job_name
+        Args:
+            user: Email address of the user to submit jobs for
+            scripts: Bash script contents, one per job
+            job_names: Optional job names matching `scripts`. Empty names default
+                to "Job - <random_id>"
+            max_concurrency: Maximum number of jobs written in parallel. None
+                (the default) uses a few more than the CPU count, at most 32.
+                Use 1 to write jobs sequentially
 
-        if job_dir.exists():
-            raise FileExistsError(f"Job '{job_name}' already exists for user '{user}'")
+        Returns:
+            List of paths to the created job directories, in submission order
 
-        job_dir.mkdir(parents=True)
+        Raises:
+            ValueError: If `job_names` and `scripts` have different lengths,
+                the same job name appears twice in the batch (ignoring case), or
+                `max_concurrency` is less than 1
+            FileExistsError: If a job with the same name (ignoring case) already
+                exists
+        """
+        if max_concurrency is None:
+            max_concurrency = _DEFAULT_SUBMIT_WORKERS
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        if job_names is None:
+            job_names = [""] * len(scripts)
+        if len(job_names) != len(scripts):
+            raise ValueError(
+                f"Got {len(scripts)} scripts but {len(job_names)} job names"
+            )
 
-        # Create run.sh file
-        run_script_path = job_dir / "run.sh"
-        with open(run_script_path, "w") as f:
-            f.write(script)
+        job_root = self._prepare_job_root(user)
 
-        # Make run.sh executable
-        os.chmod(run_script_path, 0o755)
+        # Resolve and validate every job name up front against a single listing
+        # of the job root, so a conflicting name fails before any job is written.
+        # Names are compared case-folded: on case-insensitive filesystems (and
+        # on peers syncing this folder) "Job" and "job" are the same directory.
+        job_names = [
+            name if name.strip() else _default_job_name() for name in job_names
+        ]
+        try:
+            existing = {name.casefold(): name for name in os.listdir(job_root)}
+        except FileNotFoundError:
+            existing = {}
+        seen: Set[str] = set()
+        for job_name in job_names:
+            folded = job_name.casefold()
+            if folded in existing:
+                raise FileExistsError(
+                    f"Job '{existing[folded]}' already exists for user '{user}'"
+                )
+            if folded in seen:
+                raise ValueError(f"Duplicate job name '{job_name}' in batch")
+            seen.add(folded)
 
-        # Create config.yaml file
-        config_yaml_path = job_dir / "config.yaml"
-        from datetime import datetime, timezone
+        def write_job(args: Tuple[str, str]) -> Path:
+            script, job_name = args
+            return self._write_bash_job(job_root, user, script, job_name)
 
-        job_config = {
-            "name": job_name,
-            "submitted_by": self.root_email,
-            "submitted_at": datetime.now(timezone.utc).isoformat(),
-        }
+        jobs = list(zip(scripts, job_names))
+        if max_concurrency == 1 or len(jobs) <= 1:
+            return [write_job(job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(jobs))) as pool:
+            return list(pool.map(write_job, jobs))
+
+    def _write_bash_job(
+        self, job_root: Path, user: str, script: str, job_name: str
+    ) -> Path:
+        """Create a bash job directory with run.sh and config.yaml under job_root."""
+        # Generate default job name if not provided
+        if not job_name.strip():
+            job_name = _default_job_name()
+
+        job_dir = self._create_job_dir(job_root, user, job_name)
+
+        # Create executable run.sh file
+        _write_run_script(job_dir / "run.sh", script)
 
-        with open(config_yaml_path, "w") as f:
-            yaml.dump(job_config, f, default_flow_style=False)
+        # Create config.yaml file
+        self._write_job_config(job_dir, job_name)
 
         return job_dir
 
@@ -1883,10 +1871,7 @@ class JobClient:
         """
         # Generate default job name if not provided
         if not job_name:
-            from uuid import uuid4
-
-            random_id = str(uuid4())[0:8]
-            job_name = f"Job - {random_id}"
+            job_name = _default_job_name()
 
         # Validate code_path exists
         code_path_obj = Path(code_path).expanduser().resolve()
@@ -1902,26 +1887,12 @@ class JobClient:
         if not code_path_obj.suffix == ".py":
             raise ValueError(f"Code path must be a Python file (.py): {code_path}")
 
-        # Ensure user directory exists (create if it doesn't)
-        user_dir = self.config.get_user_dir(user)
-        if not user_dir.exists():
-            user_dir.mkdir(parents=True, exist_ok=True)
-            print(f"Created user directory: {user_dir}")
-
-        # Ensure job directory structure exists
-        self._ensure_job_directories(user)
-
-        # Create job directory directly in job directory
-        job_dir = self.config.get_job_dir(user) / job_name
-
-        if job_dir.exists():
-            raise FileExistsError(f"Job '{job_name}' already exists for user '{user}'")
-
-        job_dir.mkdir(parents=True)
+        job_root = self._prepare_job_root(user)
+        job_dir = self._create_job_dir(job_root, user, job_name)
 
         # Copy Python file directly to job root directory
         destination = job_dir / code_path_obj.name
-        shutil.copy2(str(code_path_obj), str(destination))
+        _clone_or_copy(code_path_obj, destination)
 
         # Generate bash script for Python execution with uv
         dependencies = dependencies or []
@@ -1931,104 +1902,107 @@ class JobClient:
 
         # Create dependency installation commands
         deps_str = " ".join(f'"{dep}"' for dep in all_dependencies)
-        install_commands = f"""
-# Install syft-client and custom dependencies
-uv pip install {deps_str}
-"""
-
-        bash_script = f"""#!/bin/bash
-export UV_SYSTEM_PYTHON=false
-
-# Create isolated uv virtual environment
-uv venv
-
-# Activate the virtual environment
-source .venv/bin/activate
-{install_commands}
-# Execute the Python file directly from job root
-python {code_path_obj.name}
-"""
-
-        # Create run.sh file
-        run_script_path = job_dir / "run.sh"
-        with open(run_script_path, "w") as f:
-            f.write(bash_script)
+        bash_script = _PYTHON_RUN_SCRIPT_TEMPLATE.format(
+            dependencies=deps_str,
+            entry_point=code_path_obj.name,
+        )
 
-        # Make run.sh executable
-        os.chmod(run_script_path, 0o755)
+        # Create executable run.sh file
+        _write_run_script(job_dir / "run.sh", bash_script)
 
         # Create config.yaml file
-        config_yaml_path = job_dir / "config.yaml"
-        from datetime import datetime, timezone
+        self._write_job_config(
+            job_dir,
+            job_name,
+            type="python",
+            code_path=str(code_path_obj),
+            entry_point=code_path_obj.name,
+            dependencies=all_dependencies,
+        )
+
+        return job_dir
 
+    def _write_job_config(self, job_dir: Path, job_name: str, **extra: Any) -> None:
+        """Write config.yaml for a job submitted by the root user."""
         job_config = {
             "name": job_name,
             "submitted_by": self.root_email,
             "submitted_at": datetime.now(timezone.utc).isoformat(),
-            "type": "python",
-            "code_path": str(code_path_obj),
-            "entry_point": code_path_obj.name,
-            "dependencies": all_dependencies,
+            **extra,
         }
 
-        with open(config_yaml_path, "w") as f:
-            yaml.dump(job_config, f, default_flow_style=False)
-
-        return job_dir
+        with open(job_dir / "config.yaml", "w") as f:
+            yaml.dump(job_config, f, Dumper=_SafeDumper, default_flow_style=False)
 
     def _get_all_jobs(self) -> List[JobInfo]:
         """Get all jobs from all peer directories (inbox, approved, done)."""
-        jobs: list[JobInfo] = []
         syftbox_root = Path(self.config.syftbox_folder)
 
-        if not syftbox_root.exists():
-            return jobs
+        # Scan through all user directories in SyftBox root (peers) and collect
+        # the job directories directly in each user's job directory
+        job_dirs: list[Tuple[str, Path]] = []
+        for user_entry in _iter_subdirs(syftbox_root):
+            user_email = user_entry.name
+            user_job_dir = self.config.get_job_dir(user_email)
+            for job_entry in _iter_subdirs(user_job_dir):
+                job_dirs.append((user_email, Path(job_entry.path)))
 
-        # Scan through all user directories in SyftBox root (peers)
-        for user_dir in syftbox_root.iterdir():
-            if not user_dir.is_dir():
-                continue
+        # Jobs are loaded sequentially: with the config cache warm, each load is
+        # a few stat calls, which is cheaper than handing it to a thread pool
+        loaded = [self._load_job(*job) for job in job_dirs]
 
-            user_email = user_dir.name
-            user_job_dir = self.config.get_job_dir(user_email)
+        # Forget cached configs of jobs that no longer exist
+        live_configs = {os.fspath(job_dir / "config.yaml") for _, job_dir in job_dirs}
+        for config_path in self._config_cache.keys() - live_configs:
+            del self._config_cache[config_path]
 
-            if not user_job_dir.exists():
-                continue
+        return [job for job in loaded if job is not None]
 
-            # Scan for job directories directly in the job directory
-            for job_dir in user_job_dir.iterdir():
-                if not job_dir.is_dir():
-                    continue
-
-                config_file = job_dir / "config.yaml"
-                if not config_file.exists():
-                    continue
-
-                try:
-                    with open(config_file, "r") as f:
-                        job_config = yaml.safe_load(f)
-
-                    # Determine status from marker files
-                    status = self.config.get_job_status(job_dir)
-
-                    # Include all jobs from all peer directories
-                    jobs.append(
-                        JobInfo(
-                            name=job_config.get("name", job_dir.name),
-                            user=user_email,
-                            status=status,
-                            submitted_by=job_config.get("submitted_by", "unknown"),
-                            location=job_dir,
-                            config=self.config,
-                            root_email=self.root_email,
-                            submitted_at=job_config.get("submitted_at"),
-                        )
-                    )
-                except Exception:
-                    # Skip jobs with invalid config files
-                    continue
+    def _load_job(self, user_email: str, job_dir: Path) -> Optional[JobInfo]:
+        """Load a job from its directory, or None if it has no valid config.yaml."""
+        config_file = job_dir / "config.yaml"
+        try:
+            config_stat = os.stat(config_file)
+        except OSError:
+            return None
 
-        return jobs
+        try:
+            # Reuse the parsed config while the file is unchanged, so repeated
+            # listings only parse configs that were added or rewritten. A file
+            # replaced by rename (as sync clients do) gets a new inode; only an
+            # in-place rewrite to the same size within one mtime tick of the
+            # filesystem goes unnoticed.
+            config_path = os.fspath(config_file)
+            version = (
+                config_stat.st_ino,
+                config_stat.st_mtime_ns,
+                config_stat.st_size,
+            )
+            cached = self._config_cache.get(config_path)
+            if cached is not None and cached[0] == version:
+                job_config = cached[1]
+            else:
+                with open(config_file, "r") as f:
+                    job_config = yaml.load(f, Loader=_SafeLoader)
+                self._config_cache[config_path] = (version, job_config)
+
+            # Determine status from marker files
+            status = self.config.get_job_status(job_dir)
+
+            # Include all jobs from all peer directories
+            return JobInfo(
+                name=job_config.get("name", job_dir.name),
+                user=user_email,
+                status=status,
+                submitted_by=job_config.get("submitted_by", "unknown"),
+                location=job_dir,
+                config=self.config,
+                root_email=self.root_email,
+                submitted_at=job_config.get("submitted_at"),
+            )
+        except Exception:
+            # Skip jobs with invalid config files
+            return None
 
     @property
     def jobs(self) -> JobsList:
@@ -2054,8 +2028,6 @@ python {code_path_obj.name}
             # Parse submitted_at timestamp for sorting (most recent first)
             try:
                 if job.submitted_at:
-                    from datetime import datetime
-
                     # Parse ISO format timestamp
                     dt = datetime.fromisoformat(job.submitted_at.replace("Z", "+00:00"))
                     # Use negative timestamp for reverse chronological order (newest first)
@@ -2069,7 +2041,7 @@ python {code_path_obj.name}
 
             # Secondary sorting: user priority (root first), then user name, then status
             user_priority = 0 if job.user == self.root_email else 1
-            status_priority = {"inbox": 1, "approved": 2, "done": 3}.get(job.status, 4)
+            status_priority = _STATUS_PRIORITY.get(job.status, 4)
 
             return (
                 time_priority,
@@ -2079,8 +2051,9 @@ python {code_path_obj.name}
                 job.name.lower(),
             )
 
-        sorted_jobs = sorted(current_jobs, key=job_sort_key)
-        return JobsList(sorted_jobs, self.user_email)
+        # current_jobs is a fresh list owned by this call, so sort it in place
+        current_jobs.sort(key=job_sort_key)
+        return JobsList(current_jobs, self.user_email)
 
 
 def get_client(
@@ -1,8 +1,15 @@
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 
+@lru_cache(maxsize=1024)
+def _job_dir(syftbox_folder: str, user_email: str) -> Path:
+    """Build SyftBox/<user_email>/app_data/job/, once per folder and user."""
+    return Path(syftbox_folder) / user_email / "app_data" / "job"
+
+
 class SyftJobConfig(BaseModel):
     """Configuration for SyftJob system."""
 
@@ -55,7 +62,9 @@ class SyftJobConfig(BaseModel):
 
         Path: SyftBox/<user_email>/app_data/job/
         """
-        return self.get_user_dir(user_email) / "app_data" / "job"
+        # Listings and the runner ask for the same few job directories over and
+        # over, so the Path is built once and cached on the plain string inputs
+        return _job_dir(self.syftbox_folder, user_email)
 
     def get_job_status(self, job_path: Path) -> str:
         """
@@ -2,7 +2,9 @@ import os
 import shutil
 import subprocess
 import time
-from typing import List, Set
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Optional, Set
 
 from . import __version__
 from .config import SyftJobConfig
@@ -11,17 +13,32 @@ from .config import SyftJobConfig
 class SyftJobRunner:
     """Job runner that monitors inbox folder for new jobs."""
 
-    def __init__(self, config: SyftJobConfig, poll_interval: int = 5):
+    def __init__(
+        self,
+        config: SyftJobConfig,
+        poll_interval: int = 5,
+        max_poll_interval: Optional[int] = None,
+    ):
         """
         Initialize the job runner.
 
         Args:
             config: SyftJobConfig instance
             poll_interval: How often to check for new jobs (in seconds)
+            max_poll_interval: If set, the interval doubles with each further
+                consecutive poll that finds nothing to do (10, 20, 40, ... for a
+                poll_interval of 10), up to this many seconds, and drops back to
+                poll_interval as soon as a job arrives or runs
         """
         self.config = config
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
         self.known_jobs: Set[str] = set()
+        self._idle_polls = 0
+
+        # Environment for job execution, snapshotted once instead of per job
+        self._job_env = os.environ.copy()
+        self._job_env["SYFTBOX_FOLDER"] = str(self.config.syftbox_folder)
 
         # Ensure directory structure exists for the root user
         self._ensure_root_user_directories()
@@ -35,19 +52,29 @@ class SyftJobRunner:
         job_dir.mkdir(parents=True, exist_ok=True)
         print(f"Ensured directory exists: {job_dir}")
 
-    def _get_jobs_in_inbox(self) -> List[str]:
-        """Get list of job names currently in inbox status (no status markers)."""
+    def _iter_job_dirs(self) -> Iterator[Path]:
+        """Yield the root user's job directories that contain a config.yaml."""
         job_dir = self.config.get_job_dir(self.config.email)
 
-        if not job_dir.exists():
-            return []
+        # os.scandir answers is_dir() from the directory listing itself on most
+        # filesystems, and a missing job directory simply yields no jobs
+        try:
+            with os.scandir(job_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        item = Path(entry.path)
+                        if (item / "config.yaml").exists():
+                            yield item
+        except FileNotFoundError:
+            return
 
+    def _get_jobs_in_inbox(self) -> List[str]:
+        """Get list of job names currently in inbox status (no status markers)."""
         jobs = []
-        for item in job_dir.iterdir():
-            if item.is_dir() and (item / "config.yaml").exists():
-                # Check if job is in inbox status (no status markers)
-                if self.config.is_job_inbox(item):
-                    jobs.append(item.name)
+        for item in self._iter_job_dirs():
+            # Check if job is in inbox status (no status markers)
+            if self.config.is_job_inbox(item):
+                jobs.append(item.name)
 
         return jobs
 
@@ -58,33 +85,37 @@ class SyftJobRunner:
         print(f"\n🔔 NEW JOB DETECTED: {job_name}")
         print(f"📁 Location: {job_dir}")
 
-        # Check if run.sh exists and show first few lines
+        # Show the first few lines of run.sh, if it exists
         run_script = job_dir / "run.sh"
-        if run_script.exists():
-            try:
-                with open(run_script, "r") as f:
-                    all_lines = f.readlines()
-                lines = all_lines[:5]  # Show first 5 lines
-                print("📝 Script preview:")
-                for i, line in enumerate(lines, 1):
-                    print(f"   {i}: {line.rstrip()}")
-                if len(all_lines) > 5:
-                    print("   ... (more lines)")
-            except Exception as e:
-                print(f"   Could not read script: {e}")
-
-        # Check if config.yaml exists and show contents
+        try:
+            # Read only the first 5 lines, plus one to tell whether there
+            # are more, instead of loading the whole script
+            with open(run_script, "r") as f:
+                lines = list(islice(f, 5))  # Show first 5 lines
+                has_more = bool(f.readline())
+            print("📝 Script preview:")
+            for i, line in enumerate(lines, 1):
+                print(f"   {i}: {line.rstrip()}")
+            if has_more:
+                print("   ... (more lines)")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"   Could not read script: {e}")
+
+        # Show the contents of config.yaml, if it exists
         config_file = job_dir / "config.yaml"
-        if config_file.exists():
-            try:
-                with open(config_file, "r") as f:
-                    content = f.read()
-                print("⚙️  Config:")
-                for line in content.split("\n"):
-                    if line.strip():
-                        print(f"   {line}")
-            except Exception as e:
-                print(f"   Could not read config: {e}")
+        try:
+            with open(config_file, "r") as f:
+                content = f.read()
+            print("⚙️  Config:")
+            for line in content.split("\n"):
+                if line.strip():
+                    print(f"   {line}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"   Could not read config: {e}")
 
         print("-" * 50)
 
@@ -165,8 +196,8 @@ class SyftJobRunner:
                 print(f"❌ Failed to recreate job directory: {recovery_error}")
                 raise
 
-    def check_for_new_jobs(self) -> None:
-        """Check for new jobs in the inbox and print them."""
+    def check_for_new_jobs(self) -> int:
+        """Check for new jobs in the inbox, print them and return how many were found."""
         current_jobs = set(self._get_jobs_in_inbox())
         new_jobs = current_jobs - self.known_jobs
 
@@ -176,21 +207,15 @@ class SyftJobRunner:
         # Update known jobs
         self.known_jobs = current_jobs
 
+        return len(new_jobs)
+
     def _get_jobs_in_approved(self) -> List[str]:
         """Get list of job names currently in approved status (has approved but not done)."""
-        job_dir = self.config.get_job_dir(self.config.email)
-
-        if not job_dir.exists():
-            return []
-
         jobs = []
-        for item in job_dir.iterdir():
-            if item.is_dir() and (item / "config.yaml").exists():
-                # Check if job is in approved status
-                if self.config.is_job_approved(item) and not self.config.is_job_done(
-                    item
-                ):
-                    jobs.append(item.name)
+        for item in self._iter_job_dirs():
+            # Check if job is in approved status
+            if self.config.is_job_approved(item) and not self.config.is_job_done(item):
+                jobs.append(item.name)
 
         return jobs
 
@@ -218,34 +243,30 @@ class SyftJobRunner:
             # Make run.sh executable
             os.chmod(run_script, 0o755)
 
-            # Prepare environment variables
-            env = os.environ.copy()
-            env["SYFTBOX_FOLDER"] = str(self.config.syftbox_folder)
-
-            # Execute run.sh and capture output
-            result = subprocess.run(
-                ["bash", str(run_script)],
-                cwd=job_dir,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-                env=env,
-            )
+            # Write log files directly to job root directory (flat structure).
+            # Output is streamed straight into the files rather than buffered
+            # in memory, so long-running jobs can be followed with tail -f.
+            stdout_file = job_dir / "stdout.txt"
+            stderr_file = job_dir / "stderr.txt"
+            with open(stdout_file, "wb") as stdout_f, open(
+                stderr_file, "wb"
+            ) as stderr_f:
+                result = subprocess.run(
+                    ["bash", str(run_script)],
+                    cwd=job_dir,
+                    stdout=stdout_f,
+                    stderr=stderr_f,
+                    timeout=300,  # 5 minute timeout
+                    env=self._job_env,
+                )
 
             # Create done marker file to mark job as completed
             self.config.create_done_marker(job_dir)
 
-            # Write log files directly to job root directory (flat structure)
-            # Write stdout to stdout.txt
-            stdout_file = job_dir / "stdout.txt"
-            with open(stdout_file, "w") as f:
-                f.write(result.stdout)
-
-            # Also write stderr if there is any
-            if result.stderr:
-                stderr_file = job_dir / "stderr.txt"
-                with open(stderr_file, "w") as f:
-                    f.write(result.stderr)
+            # Only keep stderr.txt if there is any
+            has_stderr = stderr_file.stat().st_size > 0
+            if not has_stderr:
+                stderr_file.unlink()
 
             # Write return code
             returncode_file = job_dir / "returncode.txt"
@@ -260,8 +281,8 @@ class SyftJobRunner:
                     f"⚠️  Job {job_name} completed with return code {result.returncode}"
                 )
                 print(f"📄 Output written to {stdout_file}")
-                if result.stderr:
-                    print(f"📄 Error output written to {job_dir / 'stderr.txt'}")
+                if has_stderr:
+                    print(f"📄 Error output written to {stderr_file}")
 
             return True
 
@@ -272,12 +293,12 @@ class SyftJobRunner:
             print(f"❌ Error executing job {job_name}: {e}")
             return False
 
-    def process_approved_jobs(self) -> None:
-        """Process all jobs in the approved directory."""
+    def process_approved_jobs(self) -> int:
+        """Process all jobs in the approved directory and return how many were run."""
         approved_jobs = self._get_jobs_in_approved()
 
         if not approved_jobs:
-            return
+            return 0
 
         print(f"📋 Found {len(approved_jobs)} job(s) in approved directory")
 
@@ -289,6 +310,19 @@ class SyftJobRunner:
         if approved_jobs:
             print(f"\n✅ Processed {len(approved_jobs)} job(s)")
 
+        return len(approved_jobs)
+
+    def _next_poll_interval(self, active: bool) -> int:
+        """Return how long to sleep before the next poll, backing off while idle."""
+        if active or not self.max_poll_interval:
+            self._idle_polls = 0
+            return self.poll_interval
+
+        # Double the interval for each further consecutive idle poll, up to the cap
+        backoff = self.poll_interval * 2 ** min(self._idle_polls, 16)
+        self._idle_polls += 1
+        return max(self.poll_interval, min(backoff, self.max_poll_interval))
+
     def run(self) -> None:
         """Start monitoring the inbox and approved folders for jobs."""
         root_email = self.config.email
@@ -297,7 +331,13 @@ class SyftJobRunner:
         print(f"🚀 SyftJob Runner started: version: {__version__}")
         print(f"👤 Monitoring jobs for: {root_email}")
         print(f"📂 Job directory: {job_dir}")
-        print(f"⏱️  Poll interval: {self.poll_interval} seconds")
+        if self.max_poll_interval:
+            print(
+                f"⏱️  Poll interval: {self.poll_interval} seconds "
+                f"(backing off to {self.max_poll_interval} seconds when idle)"
+            )
+        else:
+            print(f"⏱️  Poll interval: {self.poll_interval} seconds")
         print("⏹️  Press Ctrl+C to stop")
         print("=" * 50)
 
@@ -313,9 +353,9 @@ class SyftJobRunner:
 
         try:
             while True:
-                self.check_for_new_jobs()
-                self.process_approved_jobs()
-                time.sleep(self.poll_interval)
+                new_jobs = self.check_for_new_jobs()
+                processed_jobs = self.process_approved_jobs()
+                time.sleep(self._next_poll_interval(bool(new_jobs or processed_jobs)))
         except KeyboardInterrupt:
             print("\n🛑 Job runner stopped by user")
         except Exception as e:
@@ -324,7 +364,10 @@ class SyftJobRunner:
 
 
 def create_runner(
-    syftbox_folder_path: str, email: str, poll_interval: int = 5
+    syftbox_folder_path: str,
+    email: str,
+    poll_interval: int = 5,
+    max_poll_interval: Optional[int] = None,
 ) -> SyftJobRunner:
     """
     Factory function to create a SyftJobRunner from SyftBox folder.
@@ -333,9 +376,11 @@ def create_runner(
         syftbox_folder_path: Path to the SyftBox folder
         email: Email address of the user (no inference, explicit required)
         poll_interval: How often to check for new jobs (in seconds)
+        max_poll_interval: Optional upper bound (in seconds) for backing off the
+            poll interval while no jobs arrive
 
     Returns:
         Configured SyftJobRunner instance
     """
     config = SyftJobConfig.from_syftbox_folder(syftbox_folder_path, email)
-    return SyftJobRunner(config, poll_interval)
+    return SyftJobRunner(config, poll_interval, max_poll_interval)
@@ -7,8 +7,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from .job_runner import create_runner
-
 
 def main():
     """Main entry point for syft-job-runner."""
@@ -37,6 +35,12 @@ Examples:
         default=5,
         help="How often to check for new jobs (in seconds, default: 5)",
     )
+    parser.add_argument(
+        "--max-poll-interval",
+        type=int,
+        default=None,
+        help="Back off polling while idle, up to this many seconds (default: off)",
+    )
     parser.add_argument(
         "--reset",
         action="store_true",
@@ -59,8 +63,17 @@ Examples:
         print(f"❌ Error: Path is not a directory: {syftbox_folder_path}")
         sys.exit(1)
 
+    # Imported only once arguments are valid, so --help and usage errors
+    # return without loading pydantic and the runner
+    from .job_runner import create_runner
+
     try:
-        runner = create_runner(str(syftbox_folder_path), args.email, args.poll_interval)
+        runner = create_runner(
+            str(syftbox_folder_path),
+            args.email,
+            args.poll_interval,
+            args.max_poll_interval,
+        )
 
         # Handle reset flag
         if args.reset:
@@ -0,0 +1,138 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from syft_job import get_client
+
+
+class SubmitBashJobsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.client = get_client(tmp.name, "ds@example.org")
+        self.job_root = self.client.config.get_job_dir("do@example.org")
+
+    def submit(self, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.client.submit_bash_jobs("do@example.org", *args, **kwargs)
+
+    def test_preserves_submission_order(self):
+        scripts = [f"echo {i}" for i in range(20)]
+        names = [f"job-{i}" for i in range(20)]
+
+        for max_concurrency in (None, 1, 4):
+            with self.subTest(max_concurrency=max_concurrency):
+                prefixed = [f"{max_concurrency}-{name}" for name in names]
+                paths = self.submit(scripts, prefixed, max_concurrency=max_concurrency)
+
+                self.assertEqual([path.name for path in paths], prefixed)
+                for path, script in zip(paths, scripts):
+                    self.assertEqual((path / "run.sh").read_text(), script)
+
+    def test_duplicate_name_in_batch_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.submit(["echo 1", "echo 2"], ["same", "same"])
+
+        # Names are validated before anything is written
+        self.assertFalse((self.job_root / "same").exists())
+
+    def test_existing_job_name_raises_file_exists_error(self):
+        self.submit(["echo 1"], ["taken"])
+
+        with self.assertRaises(FileExistsError):
+            self.submit(["echo 2", "echo 3"], ["fresh", "taken"])
+
+        self.assertFalse((self.job_root / "fresh").exists())
+        self.assertEqual((self.job_root / "taken" / "run.sh").read_text(), "echo 1")
+
+    def test_names_differing_only_by_case_conflict(self):
+        with self.assertRaises(ValueError):
+            self.submit(["echo 1", "echo 2"], ["Report", "report"])
+        self.assertFalse((self.job_root / "Report").exists())
+
+        self.submit(["echo 1"], ["Taken"])
+        with self.assertRaises(FileExistsError):
+            self.submit(["echo 2", "echo 3"], ["fresh", "TAKEN"])
+        self.assertFalse((self.job_root / "fresh").exists())
+
+    def test_max_concurrency_below_one_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.submit(["echo 1"], max_concurrency=0)
+
+        self.assertFalse(self.job_root.exists())
+
+
+class JobConfigCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.client = get_client(tmp.name, "do@example.org")
+            job_dir = self.client.submit_bash_job("do@example.org", "echo", "job")
+        self.config = job_dir / "config.yaml"
+
+    def job_names(self):
+        return [job.name for job in self.client.jobs]
+
+    def test_rewritten_config_is_reloaded(self):
+        self.assertEqual(self.job_names(), ["job"])
+
+        self.config.write_text(
+            self.config.read_text().replace("name: job", "name: renamed")
+        )
+
+        self.assertEqual(self.job_names(), ["renamed"])
+
+    def test_replaced_config_with_same_size_and_mtime_is_reloaded(self):
+        self.assertEqual(self.job_names(), ["job"])
+        original = os.stat(self.config)
+
+        # Replace the file by rename, keeping its size and timestamps
+        replacement = self.config.with_name("config.yaml.tmp")
+        replacement.write_text(
+            self.config.read_text().replace("name: job", "name: jab")
+        )
+        os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+        os.replace(replacement, self.config)
+
+        self.assertEqual(self.job_names(), ["jab"])
+
+
+class JobInfoHtmlTest(unittest.TestCase):
+    def test_escapes_submitter_controlled_values(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        tmp_path = Path(tmp.name)
+        code = tmp_path / "<img src=x onerror=alert(1)>.py"
+        code.write_text("print('hi')\n")
+        result = tmp_path / "<b onmouseover=alert(2)>.txt"
+        result.write_text("42")
+        syftbox = tmp_path / "SyftBox"
+        syftbox.mkdir()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            client = get_client(str(syftbox), "do@example.org")
+            job_dir = client.submit_python_job("do@example.org", str(code), "job")
+            config = job_dir / "config.yaml"
+            config.write_text(
+                config.read_text().replace(
+                    "submitted_at:", "submitted_at: <svg onload=alert(3)>\nold:"
+                )
+            )
+            job = client.jobs[0]
+            job.accept_by_depositing_result(str(result))
+            rendered = job._repr_html_()
+
+        for markup in ("<img", "<b ", "<svg"):
+            self.assertNotIn(markup, rendered)
+        self.assertIn("&lt;img src=x onerror=alert(1)&gt;.py", rendered)
+        self.assertIn("&lt;b onmouseover=alert(2)&gt;.txt", rendered)
+        self.assertIn("&lt;svg onload=alert(3)&gt;", rendered)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import contextlib
+import io
+import tempfile
+import unittest
+
+from syft_job import create_runner
+
+
+class PollIntervalTest(unittest.TestCase):
+    def make_runner(self, max_poll_interval):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return create_runner(tmp.name, "do@example.org", 10, max_poll_interval)
+
+    def test_backs_off_while_idle_and_resets_on_work(self):
+        runner = self.make_runner(60)
+
+        idle = [runner._next_poll_interval(False) for _ in range(5)]
+        self.assertEqual(idle, [10, 20, 40, 60, 60])
+
+        self.assertEqual(runner._next_poll_interval(True), 10)
+        self.assertEqual(runner._next_poll_interval(False), 10)
+        self.assertEqual(runner._next_poll_interval(False), 20)
+
+    def test_fixed_interval_without_max_poll_interval(self):
+        runner = self.make_runner(None)
+
+        idle = [runner._next_poll_interval(False) for _ in range(5)]
+        self.assertEqual(idle, [10] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()